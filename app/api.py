@@ -13,36 +13,40 @@ This is what you run with gunicorn or uvicorn and (later) deploy.
 
 from __future__ import annotations
 
-import json
+import csv
+import functools
+import logging
 import os
-import sys
-from dataclasses import asdict
+import queue
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, replace
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel
+import orjson
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import HTMLResponse, ORJSONResponse, PlainTextResponse
 
-# --- Make src/ importable ----------------------------------------------------
-
-REPO_ROOT = Path(__file__).resolve().parents[1]
-SRC_PATH = REPO_ROOT / "src"
-if str(SRC_PATH) not in sys.path:
-    sys.path.insert(0, str(SRC_PATH))
-
-from triangle_time.schema import Task, ModelParams  # noqa: E402
-from triangle_time.triangle_model import (  # noqa: E402
-    predict_time_for_task,
+from triangle_time.schema import Task, ModelParams
+from triangle_time.triangle_model import (
+    predict_and_update_task,
+    predict_time_pure,
     update_task_proportions,
 )
-from triangle_time.data_io import (  # noqa: E402
+from triangle_time.data_io import (
+    CSV_FIELDNAMES,
     load_tasks_from_csv,
-    save_tasks_to_csv,
+    task_to_csv_row,
 )
 
 # --- Config-ish constants ----------------------------------------------------
 
+# Default data files live at the repo root. triangle_time itself is an
+# installed package (`pip install -e .`), so no sys.path tweaking here.
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
 DEFAULT_PARAMS_PATH = REPO_ROOT / "model_params.json"
 DEFAULT_TASK_LOG_CSV = REPO_ROOT / "data" / "tasks_logged.csv"
 
@@ -54,11 +58,31 @@ TASK_LOG_CSV_PATH = Path(
     os.getenv("TT_TASK_LOG_CSV_PATH", str(DEFAULT_TASK_LOG_CSV))
 )
 
+# Group commit for /log_task: flush when this many rows are queued, or
+# after this many milliseconds, whichever comes first.
+LOG_BATCH_SIZE = max(1, int(os.getenv("TT_LOG_BATCH_SIZE", "64")))
+LOG_FLUSH_MS = max(0.0, float(os.getenv("TT_LOG_FLUSH_MS", "50")))
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    """Run the background task-log writer for the lifetime of the app."""
+    _start_log_writer()
+    try:
+        yield
+    finally:
+        _stop_log_writer()
+
+
 # FastAPI app: docs at /docs, our console UI at /
 app = FastAPI(
     title="Triangle Time API",
     docs_url="/docs",
     redoc_url=None,
+    default_response_class=ORJSONResponse,
+    lifespan=_lifespan,
 )
 
 
@@ -766,82 +790,266 @@ def triangle_console() -> str:
 # --- Helpers -----------------------------------------------------------------
 
 
+# Parsed params keyed by path, tagged with the file's mtime at load time.
+_PARAMS_CACHE: dict[Path, tuple[int, ModelParams]] = {}
+
+
 def load_model_params(path: Path = MODEL_PARAMS_PATH) -> ModelParams:
     """
     Load ModelParams from a JSON file.
 
     Expected keys: T_gov_star, T_azure_star, T_ds_star, eta, use_entropy.
+
+    The parsed result is cached per path and reused until the file's
+    mtime changes, so steady-state calls cost a single stat().
     """
-    if not path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        _PARAMS_CACHE.pop(path, None)
         raise FileNotFoundError(
             f"Model params file not found at {path}. "
             "Run `python -m app.cli fit data/samples/example_tasks.csv` first."
-        )
-    data = json.loads(path.read_text(encoding="utf-8"))
-    return ModelParams(**data)
+        ) from None
 
+    cached = _PARAMS_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns:
+        return cached[1]
 
-def append_task_to_csv(task: Task, path: Path = TASK_LOG_CSV_PATH) -> None:
+    data = orjson.loads(path.read_bytes())
+    params = ModelParams(**data)
+    # Plain-dict view for responses, built once per load. Params are
+    # treated as read-only after loading.
+    object.__setattr__(params, "_asdict_cache", asdict(params))
+    _PARAMS_CACHE[path] = (st.st_mtime_ns, params)
+    return params
+
+
+# Log paths whose header row is known to be on disk. Lets steady-state
+# appends skip the stat() probe.
+_HEADER_WRITTEN: set[Path] = set()
+
+
+def append_tasks_to_csv(
+    tasks: Iterable[Task],
+    path: Path = TASK_LOG_CSV_PATH,
+) -> None:
     """
-    Append a single task to the task log CSV.
+    Append tasks to the task log CSV with one write + fsync per call.
 
-    This is intentionally simple: load existing, append, overwrite.
+    Opens the file in append mode, so the cost is independent of the log
+    size. The header is only written when the file is new or empty.
     Good enough for low-volume / demo. Replace with DB/Azure in prod.
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
+    rows = [task_to_csv_row(update_task_proportions(task)) for task in tasks]
+    if not rows:
+        return
+
+    write_header = False
+    if path not in _HEADER_WRITTEN:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_header = not path.exists() or path.stat().st_size == 0
 
-    existing_tasks = []
-    if path.exists():
-        existing_tasks = load_tasks_from_csv(str(path))
+    with open(path, mode="a", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        if write_header:
+            writer.writerow(CSV_FIELDNAMES)
+        writer.writerows(rows)
+        f.flush()
+        os.fsync(f.fileno())
+    _HEADER_WRITTEN.add(path)
 
-    existing_tasks.append(update_task_proportions(task))
-    save_tasks_to_csv(existing_tasks, str(path))
 
+def append_task_to_csv(task: Task, path: Path = TASK_LOG_CSV_PATH) -> None:
+    """Append a single task to the task log CSV."""
+    append_tasks_to_csv([task], path)
 
-# --- Request / Response schemas ----------------------------------------------
 
+# --- Background task-log writer ----------------------------------------------
 
-class TaskPayload(BaseModel):
-    """
-    Input payload for both /predict_time and /log_task.
+# None is the shutdown sentinel.
+_LOG_QUEUE: "queue.Queue[Optional[Task]]" = queue.Queue()
+_LOG_WRITER: Optional[threading.Thread] = None
 
-    You can supply:
-    - Raw times: T_gov, T_azure, T_ds, (optional) T_total
-    - Optionally p_gov, p_azure, p_ds if you already have proportions.
 
-    If proportions are missing, they will be computed from times.
+def _log_writer_loop() -> None:
     """
+    Drain the log queue into the task log CSV.
 
-    task_id: Optional[str] = None
+    Blocks for the first task of a batch, then keeps collecting until
+    LOG_BATCH_SIZE tasks are queued or LOG_FLUSH_MS has elapsed, and
+    writes the whole batch with a single fsync. A failed write is logged
+    and dropped; it never stops the thread, so later rows still get
+    written.
+    """
+    stop = False
+    while not stop:
+        task = _LOG_QUEUE.get()
+        if task is None:
+            break
+
+        batch = [task]
+        deadline = time.monotonic() + LOG_FLUSH_MS / 1000.0
+        while len(batch) < LOG_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    item = _LOG_QUEUE.get(timeout=remaining)
+                else:
+                    item = _LOG_QUEUE.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                stop = True
+                break
+            batch.append(item)
+
+        try:
+            append_tasks_to_csv(batch)
+        except Exception:
+            logger.exception("Failed to write %d task(s) to task log", len(batch))
+
+
+def enqueue_task_log(task: Task) -> None:
+    """
+    Queue a task for the background log writer.
 
-    T_gov: float = 0.0
-    T_azure: float = 0.0
-    T_ds: float = 0.0
-    T_total: Optional[float] = None
+    Falls back to a synchronous append if the writer is not running
+    (e.g. the app was imported without its lifespan running).
+    """
+    if _LOG_WRITER is not None and _LOG_WRITER.is_alive():
+        _LOG_QUEUE.put(task)
+    else:
+        append_task_to_csv(task)
+
+
+def _start_log_writer() -> None:
+    global _LOG_WRITER
+    if _LOG_WRITER is None or not _LOG_WRITER.is_alive():
+        _LOG_WRITER = threading.Thread(
+            target=_log_writer_loop,
+            name="task-log-writer",
+            daemon=True,
+        )
+        _LOG_WRITER.start()
+
+
+def _stop_log_writer() -> None:
+    """Flush everything still queued, then stop the writer."""
+    global _LOG_WRITER
+    if _LOG_WRITER is not None:
+        _LOG_QUEUE.put(None)
+        _LOG_WRITER.join()
+        _LOG_WRITER = None
+
+
+# --- Request parsing ---------------------------------------------------------
+
+# Payloads are small and the math is trivial, so we skip Pydantic models and
+# response validation and parse the JSON body by hand.
+#
+# Accepted fields (same as triangle_time.schema.Task):
+# - Raw times: T_gov, T_azure, T_ds, (optional) T_total
+# - Optionally p_gov, p_azure, p_ds if you already have proportions.
+#
+# If proportions are missing, they will be computed from times.
+
+
+def _payload_float(
+    data: dict,
+    key: str,
+    default: Optional[float],
+) -> Optional[float]:
+    value = data.get(key)
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        raise HTTPException(status_code=422, detail=f"{key} must be a number.")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=422, detail=f"{key} must be a number.")
 
-    p_gov: Optional[float] = None
-    p_azure: Optional[float] = None
-    p_ds: Optional[float] = None
 
+async def _read_task_payload(request: Request) -> Task:
+    """Parse the JSON request body into a Task."""
+    try:
+        data = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(
+            status_code=400, detail="Request body must be valid JSON."
+        )
+    if not isinstance(data, dict):
+        raise HTTPException(
+            status_code=422, detail="Request body must be a JSON object."
+        )
 
-class PredictResponse(BaseModel):
-    task_id: Optional[str]
-    T_pred: float
-    model_params: dict
+    task_id = data.get("task_id")
+    return Task(
+        task_id=None if task_id is None else str(task_id),
+        T_gov=_payload_float(data, "T_gov", 0.0),
+        T_azure=_payload_float(data, "T_azure", 0.0),
+        T_ds=_payload_float(data, "T_ds", 0.0),
+        T_total=_payload_float(data, "T_total", None),
+        p_gov=_payload_float(data, "p_gov", None),
+        p_azure=_payload_float(data, "p_azure", None),
+        p_ds=_payload_float(data, "p_ds", None),
+    )
 
 
-class LogTaskResponse(BaseModel):
-    status: str
-    task: dict
+# The endpoints read the raw body (see _read_task_payload), so FastAPI has no
+# model to document; this describes it for /docs and the OpenAPI schema.
+_NUMBER_OR_NULL = {"anyOf": [{"type": "number"}, {"type": "null"}]}
+_TASK_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": {
+                    "title": "Task",
+                    "type": "object",
+                    "properties": {
+                        "task_id": {
+                            "anyOf": [{"type": "string"}, {"type": "null"}]
+                        },
+                        "T_gov": {"type": "number", "default": 0.0},
+                        "T_azure": {"type": "number", "default": 0.0},
+                        "T_ds": {"type": "number", "default": 0.0},
+                        "T_total": _NUMBER_OR_NULL,
+                        "p_gov": _NUMBER_OR_NULL,
+                        "p_azure": _NUMBER_OR_NULL,
+                        "p_ds": _NUMBER_OR_NULL,
+                    },
+                    "example": {
+                        "task_id": "T-001",
+                        "T_gov": 2.0,
+                        "T_azure": 3.0,
+                        "T_ds": 1.0,
+                    },
+                }
+            }
+        },
+    }
+}
 
 
 # --- Health + self-test ------------------------------------------------------
 
 
-@app.get("/health")
-def health() -> dict:
-    """Basic health check."""
-    return {"status": "ok"}
+@app.get("/health", response_class=PlainTextResponse)
+def health() -> str:
+    """Basic health check. Plain text so load-balancer probes stay cheap."""
+    return "ok"
+
+
+@functools.lru_cache(maxsize=4)
+def _load_sample_cached(path_str: str, mtime_ns: int) -> Tuple[Task, ...]:
+    """
+    Parse a sample CSV once per (path, mtime).
+
+    mtime_ns is only part of the cache key, so an edited file is reloaded.
+    """
+    return tuple(load_tasks_from_csv(path_str))
 
 
 @app.get("/self-test")
@@ -855,34 +1063,38 @@ def self_test() -> dict:
     4. Append that task into the task log CSV
     """
     sample_csv = REPO_ROOT / "data" / "samples" / "example_tasks.csv"
-    if not sample_csv.exists():
+    try:
+        mtime_ns = sample_csv.stat().st_mtime_ns
+    except FileNotFoundError:
         raise HTTPException(
             status_code=500,
             detail=f"Sample CSV not found at {sample_csv}",
         )
 
-    tasks = load_tasks_from_csv(str(sample_csv))
+    tasks = _load_sample_cached(str(sample_csv), mtime_ns)
     if not tasks:
         raise HTTPException(
             status_code=500,
             detail="No tasks found in example_tasks.csv",
         )
 
-    task = tasks[0]
+    # Copy: prediction fills in T_total / p_* on the task, and the cached
+    # tuple is shared between calls.
+    task = replace(tasks[0])
 
     try:
         params = load_model_params()
     except FileNotFoundError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    T_pred = predict_time_for_task(task, params)
-    append_task_to_csv(task)
+    T_pred = predict_and_update_task(task, params)
+    enqueue_task_log(task)
 
     return {
         "ok": True,
         "sample_task": asdict(task),
         "T_pred": T_pred,
-        "model_params": asdict(params),
+        "model_params": params._asdict_cache,
         "task_log_csv": str(TASK_LOG_CSV_PATH),
     }
 
@@ -890,62 +1102,48 @@ def self_test() -> dict:
 # --- Main endpoints ----------------------------------------------------------
 
 
-@app.post("/predict_time", response_model=PredictResponse)
-def predict_time(payload: TaskPayload) -> PredictResponse:
+@app.post("/predict_time", openapi_extra=_TASK_REQUEST_BODY)
+async def predict_time(request: Request) -> ORJSONResponse:
     """
     Predict the total time for a task.
 
     You can send either raw times T_G/T_A/T_D (and optional T_total),
     or pre-computed proportions p_G/p_A/p_D.
+
+    Returns: {"task_id", "T_pred", "model_params"}
     """
+    task = await _read_task_payload(request)
+
     try:
         params = load_model_params()
     except FileNotFoundError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    task = Task(
-        task_id=payload.task_id,
-        T_gov=payload.T_gov,
-        T_azure=payload.T_azure,
-        T_ds=payload.T_ds,
-        T_total=payload.T_total,
-        p_gov=payload.p_gov,
-        p_azure=payload.p_azure,
-        p_ds=payload.p_ds,
-    )
-
-    T_pred = predict_time_for_task(task, params)
+    T_pred = predict_time_pure(task, params)
 
-    return PredictResponse(
-        task_id=task.task_id,
-        T_pred=T_pred,
-        model_params=asdict(params),
+    # Returned as a response object so FastAPI skips jsonable_encoder.
+    return ORJSONResponse(
+        {
+            "task_id": task.task_id,
+            "T_pred": T_pred,
+            "model_params": params._asdict_cache,
+        }
     )
 
 
-@app.post("/log_task", response_model=LogTaskResponse)
-def log_task(payload: TaskPayload) -> LogTaskResponse:
+@app.post("/log_task", openapi_extra=_TASK_REQUEST_BODY)
+async def log_task(request: Request) -> ORJSONResponse:
     """
     Log a completed task with actual time into the CSV log.
+
+    Returns: {"status", "task"}
     """
-    task = Task(
-        task_id=payload.task_id,
-        T_gov=payload.T_gov,
-        T_azure=payload.T_azure,
-        T_ds=payload.T_ds,
-        T_total=payload.T_total,
-        p_gov=payload.p_gov,
-        p_azure=payload.p_azure,
-        p_ds=payload.p_ds,
-    )
+    task = await _read_task_payload(request)
 
     task = update_task_proportions(task)
-    append_task_to_csv(task)
+    enqueue_task_log(task)
 
-    return LogTaskResponse(
-        status="ok",
-        task=asdict(task),
-    )
+    return ORJSONResponse({"status": "ok", "task": task})
 
 
 # Convenience for local dev:
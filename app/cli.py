@@ -17,22 +17,18 @@ from __future__ import annotations
 
 import argparse
 import json
-import sys
 from dataclasses import asdict
 from pathlib import Path
 
-# --- Make src/ importable ----------------------------------------------------
+import orjson
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
-SRC_PATH = REPO_ROOT / "src"
-if str(SRC_PATH) not in sys.path:
-    sys.path.insert(0, str(SRC_PATH))
-
-from triangle_time.data_io import load_tasks_from_csv
+# Only the prediction modules are imported here. The pandas/SciPy-backed
+# data + training stack is imported inside cmd_fit so `predict` and
+# `export-params` start fast. Nothing here imports app.api (FastAPI).
 from triangle_time.schema import Task, ModelParams
-from triangle_time.training import fit_model
-from triangle_time.triangle_model import predict_time_for_task
+from triangle_time.triangle_model import predict_time_pure
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_PARAMS_PATH = REPO_ROOT / "model_params.json"
 
 
@@ -43,6 +39,9 @@ def cmd_fit(args: argparse.Namespace) -> None:
     """
     Fit model from a CSV of historical tasks and save params as JSON.
     """
+    from triangle_time.data_io import load_tasks_as_arrays
+    from triangle_time.training import fit_model_from_arrays
+
     csv_path = Path(args.csv_path).resolve()
     params_path = Path(args.params_path).resolve()
 
@@ -50,11 +49,11 @@ def cmd_fit(args: argparse.Namespace) -> None:
         raise SystemExit(f"[fit] CSV file not found: {csv_path}")
 
     print(f"[fit] Loading tasks from {csv_path} ...")
-    tasks = load_tasks_from_csv(str(csv_path))
-    print(f"[fit] Loaded {len(tasks)} tasks.")
+    columns = load_tasks_as_arrays(str(csv_path))
+    print(f"[fit] Loaded {len(columns['T_gov'])} tasks.")
 
     print("[fit] Fitting model (with entropy)...")
-    params = fit_model(tasks, use_entropy=True)
+    params = fit_model_from_arrays(columns, use_entropy=True)
 
     params_path.parent.mkdir(parents=True, exist_ok=True)
     params_json = asdict(params)
@@ -79,13 +78,13 @@ def cmd_predict(args: argparse.Namespace) -> None:
             "Run `python -m app.cli fit ...` first."
         )
 
-    task_data = json.loads(task_json_path.read_text(encoding="utf-8"))
+    task_data = orjson.loads(task_json_path.read_bytes())
     task = Task(**task_data)
 
-    params_data = json.loads(params_path.read_text(encoding="utf-8"))
+    params_data = orjson.loads(params_path.read_bytes())
     params = ModelParams(**params_data)
 
-    T_pred = predict_time_for_task(task, params)
+    T_pred = predict_time_pure(task, params)
 
     print("[predict] Input task:")
     print(json.dumps(task_data, indent=2))
@@ -0,0 +1,49 @@
+"""
+Ahead-of-time build of the numeric kernels.
+
+    python -m triangle_time._aot_build
+
+compiles the kernels from _kernels into the extension module
+triangle_time._aot_kernels, next to this file. _kernels picks it up
+automatically when present, which removes the first-call JIT latency
+(compile or cache load) from prediction and evaluation and lets the
+service run without numba installed. Needs numba and a C compiler at
+build time; run it once per target platform, e.g. as a Docker build step.
+
+numba.pycc is deprecated upstream. If it is unavailable the package keeps
+working with the JIT (or plain Python) kernels.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+from . import _kernels as k
+
+# Exported name -> (jitted source kernel, signature)
+_EXPORTS = {
+    "entropy": (k.entropy_kernel, "f8(f8, f8, f8)"),
+    "predict_base": (k.predict_base_kernel, k._PREDICT_SIGNATURE),
+    "predict_entropy": (k.predict_entropy_kernel, k._PREDICT_SIGNATURE),
+    "error_sums": (k.error_sums_kernel, "UniTuple(f8, 3)(f8[:], f8[:])"),
+    "predict_batch": (
+        k.predict_batch_kernel,
+        "void(f8[:], f8[:], f8[:], f8[:], f8, f8, f8, f8, b1, f8[:])",
+    ),
+}
+
+
+def build(output_dir: Optional[str] = None) -> None:
+    """Compile the _aot_kernels extension into output_dir (default: here)."""
+    from numba.pycc import CC  # type: ignore[import]
+
+    cc = CC("_aot_kernels")
+    cc.output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+    for name, (kernel, signature) in _EXPORTS.items():
+        cc.export(name, signature)(kernel.py_func)
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
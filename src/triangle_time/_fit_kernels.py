@@ -0,0 +1,71 @@
+"""
+Compiled kernels for model fitting.
+
+Operates on contiguous float64 columns (struct-of-arrays) rather than
+Task objects. Compiled with Numba when available (see _jit.py).
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from ._jit import njit
+
+
+@njit(cache=True, fastmath=True)
+def fit_kernel(T_gov, T_azure, T_ds, T_total, use_entropy):
+    """
+    Accumulate the normal equations for the triangle model in one pass.
+
+    Inputs are float64 arrays of equal length. T_total must not contain
+    NaN; use 0.0 for "missing" (falls back to T_gov + T_azure + T_ds).
+    Proportions are computed from the times. Tasks whose total is <= 0
+    are skipped.
+
+    Returns (XtX, Xty, n_used) where X has columns p_gov, p_azure, p_ds
+    and, if use_entropy, H(p); y is the total time.
+    """
+    k = 4 if use_entropy else 3
+    XtX = np.zeros((k, k))
+    Xty = np.zeros(k)
+    x = np.empty(k)
+    n_used = 0
+
+    for i in range(T_gov.shape[0]):
+        g = T_gov[i]
+        a = T_azure[i]
+        d = T_ds[i]
+        s = g + a + d
+
+        total = T_total[i]
+        if total <= 0.0:
+            total = s
+        if total <= 0.0:
+            # Skip degenerate tasks
+            continue
+
+        if s > 0.0:
+            x[0] = g / s
+            x[1] = a / s
+            x[2] = d / s
+        else:
+            x[0] = 0.0
+            x[1] = 0.0
+            x[2] = 0.0
+
+        if use_entropy:
+            H = 0.0
+            for j in range(3):
+                if x[j] > 0.0:
+                    H -= x[j] * math.log(x[j])
+            x[3] = H
+
+        for r in range(k):
+            Xty[r] += x[r] * total
+            for c in range(k):
+                XtX[r, c] += x[r] * x[c]
+        n_used += 1
+
+    return XtX, Xty, n_used
@@ -0,0 +1,29 @@
+"""
+Optional Numba support for the numeric kernels.
+
+Exposes `njit` and `prange`. When numba is not installed, `njit` is a
+no-op decorator and `prange` is plain `range`, so kernels still run as
+ordinary Python (correct, just not compiled).
+
+Install with: pip install "triangle-time-optimizer[jit]"
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit, prange  # type: ignore[import]
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        # Support both @njit and @njit(cache=True, ...)
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
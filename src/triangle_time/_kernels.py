@@ -0,0 +1,151 @@
+"""
+Compiled kernels for prediction and evaluation.
+
+Numba cannot see ModelParams, so these take plain floats; the public
+wrappers in triangle_model unpack params and call in here. Compiled with
+Numba when available (see _jit.py), plain Python otherwise.
+
+If the ahead-of-time extension built by _aot_build is importable, the
+names at the bottom of this module (entropy, predict_base, ...) point at
+its functions instead: no JIT compile or cache load on first call, and
+numba is not needed at runtime. The *_kernel functions stay the jitted
+sources (AOT functions cannot be called from jitted code).
+"""
+
+from __future__ import annotations
+
+import math
+
+from ._jit import njit, prange
+
+try:
+    from . import _aot_kernels  # type: ignore[attr-defined]
+
+    AOT_AVAILABLE = True
+except ImportError:
+    AOT_AVAILABLE = False
+
+
+@njit(cache=True, fastmath=True)
+def entropy_kernel(p_gov, p_azure, p_ds):
+    """H(p) = -sum p_i log p_i, with p_i <= 0 contributing zero."""
+    H = 0.0
+    if p_gov > 0.0:
+        H -= p_gov * math.log(p_gov)
+    if p_azure > 0.0:
+        H -= p_azure * math.log(p_azure)
+    if p_ds > 0.0:
+        H -= p_ds * math.log(p_ds)
+    return H
+
+
+# Two specializations instead of one kernel with a use_entropy flag:
+# ModelParams picks one at construction (use_entropy is fixed for a fitted
+# model), so no call pays for the branch. Explicit signatures compile both
+# eagerly at import (or load them from the on-disk cache) -- unless the AOT
+# build is present, in which case the jitted versions are only compiled if
+# something actually calls them.
+_PREDICT_SIGNATURE = (
+    "float64(float64, float64, float64, float64, float64, float64, float64)"
+)
+_predict_jit = (
+    njit(cache=True, fastmath=True)
+    if AOT_AVAILABLE
+    else njit(_PREDICT_SIGNATURE, cache=True, fastmath=True)
+)
+
+
+@_predict_jit
+def predict_base_kernel(
+    p_gov,
+    p_azure,
+    p_ds,
+    T_gov_star,
+    T_azure_star,
+    T_ds_star,
+    eta,
+):
+    """Base triangle model prediction: sum_i p_i * T_i_star (eta unused)."""
+    return p_gov * T_gov_star + p_azure * T_azure_star + p_ds * T_ds_star
+
+
+@_predict_jit
+def predict_entropy_kernel(
+    p_gov,
+    p_azure,
+    p_ds,
+    T_gov_star,
+    T_azure_star,
+    T_ds_star,
+    eta,
+):
+    """Entropy model prediction: sum_i p_i * T_i_star + eta * H(p)."""
+    base = p_gov * T_gov_star + p_azure * T_azure_star + p_ds * T_ds_star
+    return base + eta * entropy_kernel(p_gov, p_azure, p_ds)
+
+
+@njit(cache=True, fastmath=True)
+def error_sums_kernel(y_true, y_pred):
+    """
+    One pass over the residuals: (sum |e|, sum e^2, sum |e| / y_true).
+
+    e = y_pred - y_true; y_true must be > 0 for the last term.
+    """
+    abs_sum = 0.0
+    sq_sum = 0.0
+    ape_sum = 0.0
+    for i in range(y_true.shape[0]):
+        e = y_pred[i] - y_true[i]
+        a = abs(e)
+        abs_sum += a
+        sq_sum += e * e
+        ape_sum += a / y_true[i]
+    return abs_sum, sq_sum, ape_sum
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def predict_batch_kernel(
+    p_gov,
+    p_azure,
+    p_ds,
+    H,
+    T_gov_star,
+    T_azure_star,
+    T_ds_star,
+    eta,
+    use_entropy,
+    out,
+):
+    """
+    Multi-threaded batch prediction from proportions: fills out[i].
+
+    H is a precomputed entropy column, or an empty array to compute H(p)
+    per row (only read when use_entropy). Rows are independent, so the
+    loop is split across threads with prange.
+    """
+    have_H = H.shape[0] > 0
+    for i in prange(p_gov.shape[0]):
+        pred = p_gov[i] * T_gov_star + p_azure[i] * T_azure_star + p_ds[i] * T_ds_star
+        if use_entropy:
+            if have_H:
+                pred += eta * H[i]
+            else:
+                pred += eta * entropy_kernel(p_gov[i], p_azure[i], p_ds[i])
+        out[i] = pred
+
+
+# --- Entry points used by the Python-level wrappers -------------------------
+
+if AOT_AVAILABLE:
+    entropy = _aot_kernels.entropy
+    predict_base = _aot_kernels.predict_base
+    predict_entropy = _aot_kernels.predict_entropy
+    error_sums = _aot_kernels.error_sums
+    # Single-threaded (pycc cannot build parallel kernels)
+    predict_batch_serial = _aot_kernels.predict_batch
+else:
+    entropy = entropy_kernel
+    predict_base = predict_base_kernel
+    predict_entropy = predict_entropy_kernel
+    error_sums = error_sums_kernel
+    predict_batch_serial = None
@@ -12,18 +12,41 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import os
-from typing import Optional
+from typing import NamedTuple, Optional
 
 
-def _get_env_bool(name: str, default: bool) -> bool:
-    value = os.getenv(name)
+class _EnvSnapshot(NamedTuple):
+    """Raw values of the TT_* environment variables Config reads."""
+
+    azure_blob_connection_string: Optional[str]
+    azure_blob_container_name: Optional[str]
+    azure_sql_connection_string: Optional[str]
+    use_entropy: Optional[str]
+    default_eta: Optional[str]
+
+
+def _snapshot_env() -> _EnvSnapshot:
+    env = os.environ
+    return _EnvSnapshot(
+        azure_blob_connection_string=env.get("TT_AZURE_BLOB_CONNECTION_STRING"),
+        azure_blob_container_name=env.get("TT_AZURE_BLOB_CONTAINER_NAME"),
+        azure_sql_connection_string=env.get("TT_AZURE_SQL_CONNECTION_STRING"),
+        use_entropy=env.get("TT_USE_ENTROPY"),
+        default_eta=env.get("TT_DEFAULT_ETA"),
+    )
+
+
+# Taken once at import; refreshed by reload() / force_reload=True.
+_ENV_SNAPSHOT: _EnvSnapshot = _snapshot_env()
+
+
+def _parse_bool(value: Optional[str], default: bool) -> bool:
     if value is None:
         return default
     return value.strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
-def _get_env_float(name: str, default: float) -> float:
-    value = os.getenv(name)
+def _parse_float(value: Optional[str], default: float) -> float:
     if value is None:
         return default
     try:
@@ -53,9 +76,12 @@ class Config:
     default_eta: float = 0.0
 
     @classmethod
-    def from_env(cls) -> "Config":
+    def from_env(cls, force_reload: bool = False) -> "Config":
         """
-        Construct a Config object by reading environment variables.
+        Construct a Config object from environment variables.
+
+        Reads from the snapshot taken at import time; pass
+        `force_reload=True` to re-read os.environ first.
 
         Environment variables (all optional):
         - TT_AZURE_BLOB_CONNECTION_STRING
@@ -64,18 +90,16 @@ class Config:
         - TT_USE_ENTROPY  (true/false)
         - TT_DEFAULT_ETA  (float)
         """
+        global _ENV_SNAPSHOT
+        if force_reload:
+            _ENV_SNAPSHOT = _snapshot_env()
+        env = _ENV_SNAPSHOT
         return cls(
-            azure_blob_connection_string=os.getenv(
-                "TT_AZURE_BLOB_CONNECTION_STRING"
-            ),
-            azure_blob_container_name=os.getenv(
-                "TT_AZURE_BLOB_CONTAINER_NAME"
-            ),
-            azure_sql_connection_string=os.getenv(
-                "TT_AZURE_SQL_CONNECTION_STRING"
-            ),
-            use_entropy=_get_env_bool("TT_USE_ENTROPY", default=True),
-            default_eta=_get_env_float("TT_DEFAULT_ETA", default=0.0),
+            azure_blob_connection_string=env.azure_blob_connection_string,
+            azure_blob_container_name=env.azure_blob_container_name,
+            azure_sql_connection_string=env.azure_sql_connection_string,
+            use_entropy=_parse_bool(env.use_entropy, default=True),
+            default_eta=_parse_float(env.default_eta, default=0.0),
         )
 
 
@@ -92,5 +116,10 @@ def get_config(force_reload: bool = False) -> Config:
     """
     global _DEFAULT_CONFIG
     if _DEFAULT_CONFIG is None or force_reload:
-        _DEFAULT_CONFIG = Config.from_env()
+        _DEFAULT_CONFIG = Config.from_env(force_reload=force_reload)
     return _DEFAULT_CONFIG
+
+
+def reload() -> Config:
+    """Re-read environment variables and rebuild the shared Config (for tests)."""
+    return get_config(force_reload=True)
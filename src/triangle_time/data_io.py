@@ -2,34 +2,141 @@
 Data I/O utilities.
 
 Provides thin helpers to:
-- Load tasks from a local CSV (Excel-style usage)
+- Load tasks from a local CSV (Excel-style usage), as Task objects or
+  as columnar NumPy arrays
 - Load/save tasks to Azure Blob Storage as CSV
 - Sync a local CSV to Azure Blob
 
 Dependencies:
-- Standard library only for local CSV.
+- pandas / NumPy for reading local CSV.
 - For Azure Blob: `azure-storage-blob` package is required.
 """
 
 from __future__ import annotations
 
+import codecs
 import csv
-from dataclasses import asdict
-from io import StringIO
-from typing import Iterable, List, Optional
+import hashlib
+from io import BytesIO, TextIOWrapper
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
 
 from .config import Config, get_config
 from .schema import Task
 
-try:
-    from azure.storage.blob import BlobServiceClient  # type: ignore[import]
-except ImportError:  # pragma: no cover - optional dependency
-    BlobServiceClient = None  # type: ignore[assignment]
+
+# Column order used for every CSV we write (local or Azure Blob).
+CSV_FIELDNAMES = [
+    "task_id",
+    "T_gov",
+    "T_azure",
+    "T_ds",
+    "T_total",
+    "p_gov",
+    "p_azure",
+    "p_ds",
+]
+
+# Numeric columns: required ones default to 0.0, optional ones to None/NaN.
+_REQUIRED_FLOAT_COLUMNS = ("T_gov", "T_azure", "T_ds")
+_OPTIONAL_FLOAT_COLUMNS = ("T_total", "p_gov", "p_azure", "p_ds")
 
 
 # --- Local CSV helpers -----------------------------------------------------
 
 
+def load_tasks_as_arrays(path: str) -> Dict[str, np.ndarray]:
+    """
+    Load tasks from a CSV file as columns.
+
+    Returns a dict with:
+    - task_id: object array (None where missing)
+    - T_gov, T_azure, T_ds: float64 arrays (missing / invalid -> 0.0)
+    - T_total, p_gov, p_azure, p_ds: float64 arrays (missing -> NaN,
+      invalid -> 0.0)
+
+    Column expectations are the same as load_tasks_from_csv. Use this on
+    the training path to work on columns without building Task objects.
+    """
+    # Imported here so app.api, which only uses the csv-module helpers,
+    # starts without loading pandas
+    import pandas as pd
+
+    try:
+        # Only empty cells are missing: task ids like "NA" / "None" stay
+        # strings, as with the csv-module loader. index_col=False keeps a
+        # trailing comma on every row (Excel exports) from turning the
+        # first column into the index and shifting the others left.
+        df = pd.read_csv(
+            path,
+            dtype={"task_id": str},
+            encoding="utf-8",
+            keep_default_na=False,
+            na_values=[""],
+            index_col=False,
+        )
+    except pd.errors.EmptyDataError:
+        df = pd.DataFrame()
+    except pd.errors.ParserError:
+        # Ragged rows (extra fields): parse like the Azure loader does
+        with open(path, mode="r", newline="", encoding="utf-8") as f:
+            return _tasks_to_arrays(_tasks_from_csv_rows(csv.reader(f)))
+    n = len(df)
+
+    def _column(name: str, required: bool) -> np.ndarray:
+        fill = 0.0 if required else np.nan
+        if name not in df.columns:
+            return np.full(n, fill, dtype=np.float64)
+        col = df[name]
+        if pd.api.types.is_numeric_dtype(col):
+            arr = col.to_numpy(dtype=np.float64, na_value=np.nan)
+            if required:
+                arr = np.where(np.isnan(arr), 0.0, arr)
+            return arr
+        # Some cell is not a number: parse cell by cell with the same rules
+        # as the Azure loader (empty -> missing, unparseable -> 0.0)
+        return np.fromiter(
+            (_text_float(v, fill) if isinstance(v, str) else fill for v in col),
+            dtype=np.float64,
+            count=n,
+        )
+
+    out: Dict[str, np.ndarray] = {}
+    if "task_id" in df.columns:
+        out["task_id"] = (
+            df["task_id"].astype(object).where(df["task_id"].notna(), None)
+        ).to_numpy(dtype=object)
+    else:
+        out["task_id"] = np.full(n, None, dtype=object)
+    for name in _REQUIRED_FLOAT_COLUMNS:
+        out[name] = _column(name, required=True)
+    for name in _OPTIONAL_FLOAT_COLUMNS:
+        out[name] = _column(name, required=False)
+    return out
+
+
+def _tasks_to_arrays(tasks: List[Task]) -> Dict[str, np.ndarray]:
+    """Columns in the load_tasks_as_arrays layout, built from Task objects."""
+    nan = float("nan")
+    out: Dict[str, np.ndarray] = {
+        "task_id": np.array([t.task_id for t in tasks], dtype=object),
+    }
+    for name in _REQUIRED_FLOAT_COLUMNS:
+        out[name] = np.array([getattr(t, name) for t in tasks], dtype=np.float64)
+    for name in _OPTIONAL_FLOAT_COLUMNS:
+        values = [getattr(t, name) for t in tasks]
+        out[name] = np.array(
+            [nan if v is None else v for v in values], dtype=np.float64
+        )
+    return out
+
+
+def _optional_floats(arr: np.ndarray) -> list:
+    """Convert a float64 column to Python floats, with NaN -> None."""
+    return [None if v != v else v for v in arr.tolist()]
+
+
 def load_tasks_from_csv(path: str) -> List[Task]:
     """
     Load tasks from a CSV file.
@@ -41,41 +148,115 @@ def load_tasks_from_csv(path: str) -> List[Task]:
 
     Extra columns are ignored.
     """
+    cols = load_tasks_as_arrays(path)
+    return [
+        Task._from_floats(
+            task_id=task_id,
+            T_gov=T_gov,
+            T_azure=T_azure,
+            T_ds=T_ds,
+            T_total=T_total,
+            p_gov=p_gov,
+            p_azure=p_azure,
+            p_ds=p_ds,
+        )
+        for task_id, T_gov, T_azure, T_ds, T_total, p_gov, p_azure, p_ds in zip(
+            cols["task_id"].tolist(),
+            cols["T_gov"].tolist(),
+            cols["T_azure"].tolist(),
+            cols["T_ds"].tolist(),
+            _optional_floats(cols["T_total"]),
+            _optional_floats(cols["p_gov"]),
+            _optional_floats(cols["p_azure"]),
+            _optional_floats(cols["p_ds"]),
+        )
+    ]
+
+
+def task_to_csv_row(task: Task) -> tuple:
+    """Return a task's values in CSV_FIELDNAMES order."""
+    return (
+        task.task_id,
+        task.T_gov,
+        task.T_azure,
+        task.T_ds,
+        task.T_total,
+        task.p_gov,
+        task.p_azure,
+        task.p_ds,
+    )
+
+
+def _text_float(val: str, missing: Optional[float]) -> Optional[float]:
+    """
+    Parse a CSV cell as a float.
+
+    Empty cells return `missing`; unparseable ones return 0.0.
+    """
+    if not val:
+        return missing
+    try:
+        return float(val)
+    except ValueError:
+        return 0.0
+
+
+def _cell_float(
+    row: List[str],
+    i: Optional[int],
+    missing: Optional[float],
+) -> Optional[float]:
+    """
+    Parse row[i] as a float.
+
+    Absent or empty cells return `missing`; unparseable ones return 0.0.
+    """
+    if i is None or i >= len(row):
+        return missing
+    return _text_float(row[i], missing)
+
+
+def _tasks_from_csv_rows(rows: Iterator[List[str]]) -> List[Task]:
+    """
+    Build tasks from positional CSV rows (first row is the header).
+
+    Same column rules as load_tasks_from_csv. Used for CSV text that does
+    not come from a local file (e.g. Azure Blob downloads).
+    """
+    header = next(rows, None)
+    if header is None:
+        return []
+    idx = {name: i for i, name in enumerate(header)}
+    i_id = idx.get("task_id")
+    i_gov = idx.get("T_gov")
+    i_azure = idx.get("T_azure")
+    i_ds = idx.get("T_ds")
+    i_total = idx.get("T_total")
+    i_p_gov = idx.get("p_gov")
+    i_p_azure = idx.get("p_azure")
+    i_p_ds = idx.get("p_ds")
+
+    # Local bindings keep the per-row loop cheap
+    cell = _cell_float
+    from_floats = Task._from_floats
     tasks: List[Task] = []
-    with open(path, mode="r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if not row:
-                continue
-
-            def _f(key: str, default: float = 0.0) -> float:
-                val = row.get(key)
-                if val in (None, ""):
-                    return default
-                try:
-                    return float(val)
-                except ValueError:
-                    return default
-
-            task = Task(
-                task_id=row.get("task_id") or None,
-                T_gov=_f("T_gov"),
-                T_azure=_f("T_azure"),
-                T_ds=_f("T_ds"),
-                T_total=_f("T_total", default=0.0)
-                if row.get("T_total") not in (None, "")
-                else None,
-                p_gov=_f("p_gov", default=0.0)
-                if row.get("p_gov") not in (None, "")
-                else None,
-                p_azure=_f("p_azure", default=0.0)
-                if row.get("p_azure") not in (None, "")
-                else None,
-                p_ds=_f("p_ds", default=0.0)
-                if row.get("p_ds") not in (None, "")
-                else None,
+    append = tasks.append
+    for row in rows:
+        if not row:
+            continue
+        task_id = row[i_id] if i_id is not None and i_id < len(row) else None
+        append(
+            from_floats(
+                task_id=task_id or None,
+                T_gov=cell(row, i_gov, 0.0),
+                T_azure=cell(row, i_azure, 0.0),
+                T_ds=cell(row, i_ds, 0.0),
+                T_total=cell(row, i_total, None),
+                p_gov=cell(row, i_p_gov, None),
+                p_azure=cell(row, i_p_azure, None),
+                p_ds=cell(row, i_p_ds, None),
             )
-            tasks.append(task)
+        )
     return tasks
 
 
@@ -86,36 +267,25 @@ def save_tasks_to_csv(tasks: Iterable[Task], path: str) -> None:
     Columns:
     task_id, T_gov, T_azure, T_ds, T_total, p_gov, p_azure, p_ds
     """
-    fieldnames = [
-        "task_id",
-        "T_gov",
-        "T_azure",
-        "T_ds",
-        "T_total",
-        "p_gov",
-        "p_azure",
-        "p_ds",
-    ]
-
     with open(path, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for task in tasks:
-            row = asdict(task)
-            # Ensure all expected keys exist
-            out = {key: row.get(key) for key in fieldnames}
-            writer.writerow(out)
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDNAMES)
+        writer.writerows([task_to_csv_row(task) for task in tasks])
 
 
 # --- Azure Blob helpers ----------------------------------------------------
 
 
 def _get_blob_service(config: Optional[Config] = None):
-    if BlobServiceClient is None:
+    # Imported lazily: the Azure SDK is an optional dependency and slow to
+    # import, and local-only (CLI) usage never needs it.
+    try:
+        from azure.storage.blob import BlobServiceClient  # type: ignore[import]
+    except ImportError as e:  # pragma: no cover - optional dependency
         raise ImportError(
             "azure-storage-blob is required for Azure Blob operations. "
             "Install via `pip install azure-storage-blob`."
-        )
+        ) from e
     cfg = config or get_config()
     if not cfg.azure_blob_connection_string:
         raise ValueError(
@@ -127,6 +297,27 @@ def _get_blob_service(config: Optional[Config] = None):
     ), cfg
 
 
+def _iter_text_lines(chunks: Iterable[bytes], encoding: str) -> Iterator[str]:
+    """
+    Decode a stream of byte chunks and yield newline-terminated lines.
+
+    Chunk boundaries may fall anywhere, including inside a multi-byte
+    character or a line, so decoding is incremental and the trailing
+    partial line is carried over to the next chunk.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending = ""
+    for chunk in chunks:
+        pending += decoder.decode(chunk)
+        parts = pending.split("\n")
+        pending = parts.pop()
+        for part in parts:
+            yield part + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
 def load_tasks_from_azure_blob(
     blob_name: str,
     *,
@@ -149,44 +340,11 @@ def load_tasks_from_azure_blob(
 
     blob_client = service_client.get_blob_client(container=container, blob=blob_name)
     download_stream = blob_client.download_blob()
-    csv_text = download_stream.readall().decode("utf-8")
 
-    # Reuse our local CSV loader on an in-memory string
-    tasks: List[Task] = []
-    reader = csv.DictReader(StringIO(csv_text))
-    for row in reader:
-        if not row:
-            continue
-
-        def _f(key: str, default: float = 0.0) -> float:
-            val = row.get(key)
-            if val in (None, ""):
-                return default
-            try:
-                return float(val)
-            except ValueError:
-                return default
-
-        task = Task(
-            task_id=row.get("task_id") or None,
-            T_gov=_f("T_gov"),
-            T_azure=_f("T_azure"),
-            T_ds=_f("T_ds"),
-            T_total=_f("T_total", default=0.0)
-            if row.get("T_total") not in (None, "")
-            else None,
-            p_gov=_f("p_gov", default=0.0)
-            if row.get("p_gov") not in (None, "")
-            else None,
-            p_azure=_f("p_azure", default=0.0)
-            if row.get("p_azure") not in (None, "")
-            else None,
-            p_ds=_f("p_ds", default=0.0)
-            if row.get("p_ds") not in (None, "")
-            else None,
-        )
-        tasks.append(task)
-    return tasks
+    # Parse chunk by chunk instead of holding the whole blob (bytes + str)
+    # in memory.
+    lines = _iter_text_lines(download_stream.chunks(), encoding="utf-8")
+    return _tasks_from_csv_rows(csv.reader(lines))
 
 
 def save_tasks_to_azure_blob(
@@ -209,29 +367,30 @@ def save_tasks_to_azure_blob(
             "Set TT_AZURE_BLOB_CONTAINER_NAME or pass container_name."
         )
 
-    # Serialize to in-memory CSV
-    fieldnames = [
-        "task_id",
-        "T_gov",
-        "T_azure",
-        "T_ds",
-        "T_total",
-        "p_gov",
-        "p_azure",
-        "p_ds",
-    ]
-    buffer = StringIO()
-    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
-    writer.writeheader()
-    for task in tasks:
-        row = asdict(task)
-        out = {key: row.get(key) for key in fieldnames}
-        writer.writerow(out)
-
-    csv_bytes = buffer.getvalue().encode("utf-8")
+    from azure.storage.blob import ContentSettings  # type: ignore[import]
+
+    # Serialize straight to UTF-8 bytes (no intermediate str copy)
+    raw = BytesIO()
+    text = TextIOWrapper(raw, encoding="utf-8", newline="")
+    writer = csv.writer(text)
+    writer.writerow(CSV_FIELDNAMES)
+    writer.writerows([task_to_csv_row(task) for task in tasks])
+    text.flush()
+    text.detach()
+    csv_bytes = raw.getvalue()
+
+    # Send the MD5 along so the service can verify the upload
+    content_settings = ContentSettings(
+        content_type="text/csv",
+        content_md5=hashlib.md5(csv_bytes, usedforsecurity=False).digest(),
+    )
 
     blob_client = service_client.get_blob_client(container=container, blob=blob_name)
-    blob_client.upload_blob(csv_bytes, overwrite=True)
+    blob_client.upload_blob(
+        csv_bytes,
+        overwrite=True,
+        content_settings=content_settings,
+    )
 
 
 def sync_csv_to_azure_blob(
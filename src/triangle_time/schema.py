@@ -3,22 +3,29 @@ Data schemas for the triangle-time system.
 
 Defines:
 - Task: a single work item with time breakdown + triangle proportions
+- TaskTable: many tasks stored as NumPy columns (struct-of-arrays)
 - ModelParams: parameters of the triangle time model
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Mapping, Optional, Sequence
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class Task:
     """
     Represents a single task / ticket / project instance.
 
     Times are in arbitrary but consistent units (e.g., hours).
     Proportions are barycentric coordinates inside the triangle.
+
+    If all three of p_gov / p_azure / p_ds are set they are used as-is,
+    with no sum check and regardless of T_total; otherwise they are
+    computed from the times (see triangle_model.update_task_proportions).
     """
 
     task_id: Optional[str] = None
@@ -45,6 +52,117 @@ class Task:
         if self.T_total is not None:
             self.T_total = float(self.T_total)
 
+    @classmethod
+    def _from_floats(
+        cls,
+        *,
+        task_id: Optional[str] = None,
+        T_gov: float,
+        T_azure: float,
+        T_ds: float,
+        T_total: Optional[float] = None,
+        p_gov: Optional[float] = None,
+        p_azure: Optional[float] = None,
+        p_ds: Optional[float] = None,
+    ) -> "Task":
+        """
+        Build a Task from values that are already floats.
+
+        Skips the float() coercion in __post_init__. Internal fast path
+        for loaders that have already parsed every numeric field; external
+        input should go through Task(...).
+        """
+        task = cls.__new__(cls)
+        task.task_id = task_id
+        task.T_gov = T_gov
+        task.T_azure = T_azure
+        task.T_ds = T_ds
+        task.T_total = T_total
+        task.p_gov = p_gov
+        task.p_azure = p_azure
+        task.p_ds = p_ds
+        return task
+
+
+@dataclass(frozen=True)
+class TaskTable:
+    """
+    Columnar (struct-of-arrays) view of many tasks.
+
+    Every column is a float64 array of the same length. Optional Task
+    fields (T_total, p_*) are NaN where the task had None. Build it once
+    per dataset and hand it to training / evaluation instead of a list
+    of Task objects.
+    """
+
+    T_gov: np.ndarray
+    T_azure: np.ndarray
+    T_ds: np.ndarray
+    T_total: np.ndarray
+    p_gov: np.ndarray
+    p_azure: np.ndarray
+    p_ds: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.T_gov.shape[0])
+
+    @classmethod
+    def from_tasks(cls, tasks: Sequence[Task]) -> "TaskTable":
+        """Convert Task objects into columns (one pass per column)."""
+        # A known count lets fromiter allocate the final array up front
+        n = len(tasks)
+        nan = float("nan")
+        return cls(
+            T_gov=np.fromiter((t.T_gov for t in tasks), dtype=np.float64, count=n),
+            T_azure=np.fromiter((t.T_azure for t in tasks), dtype=np.float64, count=n),
+            T_ds=np.fromiter((t.T_ds for t in tasks), dtype=np.float64, count=n),
+            T_total=np.fromiter(
+                (nan if t.T_total is None else t.T_total for t in tasks),
+                dtype=np.float64,
+                count=n,
+            ),
+            p_gov=np.fromiter(
+                (nan if t.p_gov is None else t.p_gov for t in tasks),
+                dtype=np.float64,
+                count=n,
+            ),
+            p_azure=np.fromiter(
+                (nan if t.p_azure is None else t.p_azure for t in tasks),
+                dtype=np.float64,
+                count=n,
+            ),
+            p_ds=np.fromiter(
+                (nan if t.p_ds is None else t.p_ds for t in tasks),
+                dtype=np.float64,
+                count=n,
+            ),
+        )
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, np.ndarray]) -> "TaskTable":
+        """
+        Wrap a dict of columns, e.g. from data_io.load_tasks_as_arrays.
+
+        T_gov, T_azure, T_ds are required; missing optional columns are
+        filled with NaN.
+        """
+        T_gov = np.ascontiguousarray(columns["T_gov"], dtype=np.float64)
+
+        def _opt(name: str) -> np.ndarray:
+            if name in columns:
+                return np.ascontiguousarray(columns[name], dtype=np.float64)
+            return np.full(T_gov.shape[0], np.nan)
+
+        return cls(
+            T_gov=T_gov,
+            T_azure=np.ascontiguousarray(columns["T_azure"], dtype=np.float64),
+            T_ds=np.ascontiguousarray(columns["T_ds"], dtype=np.float64),
+            T_total=_opt("T_total"),
+            p_gov=_opt("p_gov"),
+            p_azure=_opt("p_azure"),
+            p_ds=_opt("p_ds"),
+        )
+
 
 @dataclass
 class ModelParams:
@@ -56,6 +174,11 @@ class ModelParams:
 
     eta is the coefficient for the entropy-based "mixing" term. If
     use_entropy is False, eta is typically 0.0 and H(p) is ignored.
+
+    Unlike Task this keeps an instance __dict__: there are only a handful
+    of instances per process, and derived caches (the prediction kernel
+    triangle_model picks from use_entropy, loader-side caches) are
+    attached to them.
     """
 
     T_gov_star: float
@@ -9,93 +9,337 @@ Responsibilities:
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Sequence
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
 import numpy as np
+from scipy.linalg import cho_factor, cho_solve, solve_triangular
 
-from .schema import Task, ModelParams
+from ._fit_kernels import fit_kernel
+from ._jit import NUMBA_AVAILABLE
+from ._kernels import AOT_AVAILABLE, error_sums
+from .schema import Task, TaskTable, ModelParams
 from .triangle_model import (
-    proportions_from_times,
-    entropy_from_proportions,
-    predict_time_for_task,
+    entropy_from_proportions_batch,
+    predict_times_from_proportions_batch,
+    proportions_from_times_batch,
 )
 
 
-def _prepare_training_matrices(
-    tasks: Sequence[Task],
-    use_entropy: bool,
-) -> tuple[np.ndarray, np.ndarray]:
-    """
-    Build design matrix X and target vector y for least squares.
+def _as_table(tasks: Union[Sequence[Task], TaskTable]) -> TaskTable:
+    """Route Task sequences through a one-time columnar conversion."""
+    if isinstance(tasks, TaskTable):
+        return tasks
+    return TaskTable.from_tasks(tasks)
+
+
+def _total_column(table: TaskTable) -> np.ndarray:
+    """T_total, falling back to T_gov + T_azure + T_ds where missing or <= 0."""
+    Tt = table.T_total
+    time_sum = table.T_gov + table.T_azure + table.T_ds
+    return np.where(np.isnan(Tt) | (Tt <= 0.0), time_sum, Tt)
 
-    X columns:
-    - p_gov
-    - p_azure
-    - p_ds
-    - (optional) H(p) if use_entropy is True
 
-    y: T_total
+@dataclass(frozen=True)
+class DatasetArrays:
     """
-    X_rows: List[List[float]] = []
-    y_vals: List[float] = []
+    A dataset preprocessed once for training and evaluation.
+
+    All columns have one entry per task:
+    - T_gov, T_azure, T_ds: raw times
+    - total: T_total (T_gov + T_azure + T_ds if missing or <= 0)
+    - p_gov, p_azure, p_ds: training proportions, computed from the times
+      (or supplied via prepare_dataset's precomputed_proportions)
+    - eval_p_gov, eval_p_azure, eval_p_ds: evaluation proportions, the
+      task-provided p_* where all three are set, else the training ones
+      (the very same arrays when no task provides proportions)
+    - mask: True for tasks usable as training / evaluation rows (total > 0)
+
+    The masked columns and the entropy columns are computed on first use
+    and kept, so fitting and then evaluating on the same DatasetArrays
+    pays for them once.
+    """
+
+    T_gov: np.ndarray
+    T_azure: np.ndarray
+    T_ds: np.ndarray
+    total: np.ndarray
+    p_gov: np.ndarray
+    p_azure: np.ndarray
+    p_ds: np.ndarray
+    eval_p_gov: np.ndarray
+    eval_p_azure: np.ndarray
+    eval_p_ds: np.ndarray
+    mask: np.ndarray
+
+    def _masked(self, *cols: np.ndarray) -> Tuple[np.ndarray, ...]:
+        if self.mask.all():
+            # Only pay for the boolean-index copies when something is skipped
+            return cols
+        mask = self.mask
+        return tuple(c[mask] for c in cols)
+
+    def _eval_is_training(self) -> bool:
+        return self.eval_p_gov is self.p_gov
+
+    @cached_property
+    def valid_columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """(p_gov, p_azure, p_ds, total) restricted to the rows in mask."""
+        return self._masked(self.p_gov, self.p_azure, self.p_ds, self.total)
+
+    @cached_property
+    def entropy(self) -> np.ndarray:
+        """H(p) for the rows in mask (aligned with valid_columns)."""
+        p_gov, p_azure, p_ds, _ = self.valid_columns
+        return entropy_from_proportions_batch(p_gov, p_azure, p_ds)
+
+    @cached_property
+    def eval_valid_columns(
+        self,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """(eval_p_gov, eval_p_azure, eval_p_ds, total) for the rows in mask."""
+        if self._eval_is_training():
+            return self.valid_columns
+        return self._masked(
+            self.eval_p_gov, self.eval_p_azure, self.eval_p_ds, self.total
+        )
+
+    @cached_property
+    def eval_entropy(self) -> np.ndarray:
+        """H(p) of the evaluation proportions (aligned with eval_valid_columns)."""
+        if self._eval_is_training():
+            return self.entropy
+        p_gov, p_azure, p_ds, _ = self.eval_valid_columns
+        return entropy_from_proportions_batch(p_gov, p_azure, p_ds)
 
-    for t in tasks:
-        # Compute total if missing
-        if t.T_total is None or t.T_total <= 0.0:
-            total = t.T_gov + t.T_azure + t.T_ds
-        else:
-            total = t.T_total
 
-        if total <= 0.0:
-            # Skip degenerate tasks
-            continue
+TaskData = Union[Sequence[Task], TaskTable, DatasetArrays]
 
-        p_gov, p_azure, p_ds = (
-            (t.p_gov, t.p_azure, t.p_ds)
-            if t.p_gov is not None and t.p_azure is not None and t.p_ds is not None
-            else proportions_from_times(t.T_gov, t.T_azure, t.T_ds)
+
+def prepare_dataset(
+    tasks: Union[Sequence[Task], TaskTable],
+    *,
+    precomputed_proportions: Optional[np.ndarray] = None,
+) -> DatasetArrays:
+    """
+    Compute totals, proportions and the validity mask for a dataset.
+
+    Training proportions are always computed from the times; task-stored
+    p_* are ignored there. To supply your own, pass precomputed_proportions
+    as a (3, N) array with rows p_gov, p_azure, p_ds. Evaluation keeps
+    honouring task-stored p_* (see DatasetArrays).
+
+    Pass the result to fit_model and evaluate_model (e.g. on both sides
+    of a train/test workflow) so the preprocessing runs only once.
+    """
+    table = _as_table(tasks)
+    total = _total_column(table)
+    if precomputed_proportions is None:
+        p_gov, p_azure, p_ds = proportions_from_times_batch(
+            table.T_gov, table.T_azure, table.T_ds
         )
+    else:
+        P = np.asarray(precomputed_proportions, dtype=np.float64)
+        if P.shape != (3, len(table)):
+            raise ValueError(
+                f"precomputed_proportions must have shape (3, {len(table)}), "
+                f"got {P.shape}"
+            )
+        p_gov, p_azure, p_ds = P
+
+    eval_p = [p_gov, p_azure, p_ds]
+    given = [table.p_gov, table.p_azure, table.p_ds]
+    has_p = ~(np.isnan(given[0]) | np.isnan(given[1]) | np.isnan(given[2]))
+    if has_p.any():
+        eval_p = [np.where(has_p, g, p) for g, p in zip(given, eval_p)]
+
+    return DatasetArrays(
+        T_gov=table.T_gov,
+        T_azure=table.T_azure,
+        T_ds=table.T_ds,
+        total=total,
+        p_gov=p_gov,
+        p_azure=p_azure,
+        p_ds=p_ds,
+        eval_p_gov=eval_p[0],
+        eval_p_azure=eval_p[1],
+        eval_p_ds=eval_p[2],
+        mask=total > 0.0,
+    )
 
-        row = [p_gov, p_azure, p_ds]
 
-        if use_entropy:
-            H = entropy_from_proportions(p_gov, p_azure, p_ds)
-            row.append(H)
+def _as_dataset(
+    tasks: TaskData,
+    precomputed_proportions: Optional[np.ndarray] = None,
+) -> DatasetArrays:
+    if isinstance(tasks, DatasetArrays):
+        if precomputed_proportions is not None:
+            raise ValueError(
+                "precomputed_proportions cannot be combined with DatasetArrays; "
+                "pass it to prepare_dataset instead."
+            )
+        return tasks
+    return prepare_dataset(tasks, precomputed_proportions=precomputed_proportions)
 
-        X_rows.append(row)
-        y_vals.append(total)
 
-    if not X_rows:
-        raise ValueError("No valid tasks for training (all had zero or missing time).")
+def _feature_columns(
+    data: DatasetArrays,
+    use_entropy: bool,
+) -> tuple[List[np.ndarray], np.ndarray]:
+    """
+    Regression features (as separate columns) and target for valid tasks.
 
-    X = np.asarray(X_rows, dtype=float)
-    y = np.asarray(y_vals, dtype=float)
-    return X, y
+    Features: p_gov, p_azure, p_ds and, if use_entropy, H(p).
+    Target: total.
+
+    Tasks outside data.mask (total <= 0) are skipped, so the columns may
+    be empty. The arrays are shared with data's cache: do not modify them.
+    """
+    p_gov, p_azure, p_ds, total = data.valid_columns
+    features = [p_gov, p_azure, p_ds]
+    if use_entropy:
+        features.append(data.entropy)
+    return features, total
+
+
+def _gram_from_columns(
+    features: List[np.ndarray],
+    y: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute X^T X and X^T y directly from the feature columns.
+
+    X has the feature columns (p_gov, p_azure, p_ds and optionally H(p))
+    and y the totals, but the N x k matrix is never materialized: with
+    k <= 4 this is at most 10 + 4 dot products over length-N vectors.
+    """
+    k = len(features)
+    XtX = np.empty((k, k), dtype=np.float64)
+    Xty = np.empty(k, dtype=np.float64)
+    for i in range(k):
+        Xty[i] = np.dot(features[i], y)
+        for j in range(i, k):
+            XtX[i, j] = XtX[j, i] = np.dot(features[i], features[j])
+    return XtX, Xty
 
 
 def fit_model(
-    tasks: Sequence[Task],
+    tasks: TaskData,
     *,
     use_entropy: bool = True,
+    precomputed_proportions: Optional[np.ndarray] = None,
 ) -> ModelParams:
     """
     Fit the triangle time model parameters from historical tasks.
 
-    Uses ordinary least squares:
+    Uses ordinary least squares (Cholesky on the normal equations, QR on
+    the design matrix when those are ill-conditioned):
 
         T_k ≈ p_Gk * T_gov_star
              + p_Ak * T_azure_star
              + p_Dk * T_ds_star
              + eta * H(p_k)  (if use_entropy is True)
 
+    p_k is computed from the task's times unless precomputed_proportions
+    is given (see prepare_dataset).
+
     Returns:
         ModelParams with fitted T_*_star and eta.
     """
-    X, y = _prepare_training_matrices(tasks, use_entropy=use_entropy)
+    features, y = _feature_columns(
+        _as_dataset(tasks, precomputed_proportions), use_entropy
+    )
+    if y.size == 0:
+        raise ValueError("No valid tasks for training (all had zero or missing time).")
+
+    beta = _solve_cholesky(*_gram_from_columns(features, y))
+    if beta is None:
+        beta = _solve_qr(features, y)
+
+    return _params_from_beta(beta, use_entropy=use_entropy)
+
+
+def fit_model_from_arrays(
+    columns: Union[Mapping[str, np.ndarray], TaskTable],
+    *,
+    use_entropy: bool = True,
+) -> ModelParams:
+    """
+    Fit the triangle time model from columnar task data.
+
+    `columns` is a TaskTable or a dict with float64 arrays T_gov, T_azure,
+    T_ds and optionally T_total (NaN / <= 0 means "use the sum of the
+    times"), e.g. the output of data_io.load_tasks_as_arrays. Proportions
+    are computed from the times.
+
+    Same model as fit_model, but with numba installed the normal equations
+    are accumulated by a compiled kernel in a single pass. Without numba
+    that kernel would be a per-row Python loop, so the vectorized
+    fit_model path is used instead.
+    """
+    if not isinstance(columns, TaskTable):
+        columns = TaskTable.from_columns(columns)
+    if not NUMBA_AVAILABLE:
+        return fit_model(columns, use_entropy=use_entropy)
+
+    T_total = np.nan_to_num(columns.T_total, nan=0.0)
+
+    XtX, Xty, n_used = fit_kernel(
+        columns.T_gov, columns.T_azure, columns.T_ds, T_total, use_entropy
+    )
+    if n_used == 0:
+        raise ValueError("No valid tasks for training (all had zero or missing time).")
+
+    beta = _solve_cholesky(XtX, Xty)
+    if beta is None:
+        # Rare: rebuild the feature columns for the QR fallback
+        features, y = _feature_columns(prepare_dataset(columns), use_entropy)
+        beta = _solve_qr(features, y)
+
+    return _params_from_beta(beta, use_entropy=use_entropy)
+
+
+def _solve_cholesky(XtX: np.ndarray, Xty: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Solve (X^T X) beta = X^T y with a Cholesky factorization.
+
+    X has only 3-4 columns, so this is a tiny k x k solve instead of a
+    factorization of the full N x k matrix. Returns None when X^T X is
+    singular or badly conditioned (forming it squares cond(X)); callers
+    then fall back to _solve_qr.
+    """
+    try:
+        c, lower = cho_factor(XtX, check_finite=False)
+    except np.linalg.LinAlgError:
+        return None
+    # diag(c) ratio squared ~ 1 / cond(X^T X); bail out past ~1e12
+    d = np.abs(np.diag(c))
+    if d.min() <= d.max() * 1e-6:
+        return None
+    return cho_solve((c, lower), Xty, check_finite=False)
+
+
+def _solve_qr(features: List[np.ndarray], y: np.ndarray) -> np.ndarray:
+    """
+    Least squares on X itself via a reduced QR: R beta = Q^T y.
+
+    Works with cond(X) rather than cond(X)^2, so it copes with clustered
+    proportions that defeat Cholesky. Rank-deficient X (e.g. fewer tasks
+    than parameters) gets the minimum-norm lstsq solution instead.
+    """
+    X = np.column_stack(features)
+    if X.shape[0] >= X.shape[1]:
+        Q, R = np.linalg.qr(X)
+        d = np.abs(np.diag(R))
+        if d.min() > d.max() * 1e-12:
+            return solve_triangular(R, Q.T @ y, check_finite=False)
 
-    # Solve least squares: minimize ||X * beta - y||_2
     beta, *_ = np.linalg.lstsq(X, y, rcond=None)
+    return beta
 
+
+def _params_from_beta(beta: np.ndarray, *, use_entropy: bool) -> ModelParams:
     if use_entropy:
         if beta.shape[0] != 4:
             raise RuntimeError(
@@ -119,8 +363,26 @@ def fit_model(
     )
 
 
+def _error_sums(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+) -> tuple[float, float, float]:
+    """(sum |e|, sum e^2, sum |e| / y_true) for e = y_pred - y_true."""
+    if NUMBA_AVAILABLE or AOT_AVAILABLE:
+        # Fused single pass, no N-sized temporaries
+        return error_sums(y_true, y_pred)
+
+    # NumPy fallback: one scratch buffer reused for every term
+    buf = np.subtract(y_pred, y_true)
+    sq_sum = float(np.dot(buf, buf))
+    np.abs(buf, out=buf)
+    abs_sum = float(buf.sum())
+    np.divide(buf, y_true, out=buf)
+    return abs_sum, sq_sum, float(buf.sum())
+
+
 def evaluate_model(
-    tasks: Iterable[Task],
+    tasks: Union[Iterable[Task], TaskTable, DatasetArrays],
     params: ModelParams,
 ) -> Dict[str, float]:
     """
@@ -131,47 +393,40 @@ def evaluate_model(
     - mae:       mean absolute error
     - mse:       mean squared error
     - rmse:      root mean squared error
-    - mape:      mean absolute percentage error (0 if any true value is 0)
-    """
-    y_true: List[float] = []
-    y_pred: List[float] = []
-
-    for t in tasks:
-        # Determine ground truth total time
-        if t.T_total is None or t.T_total <= 0.0:
-            total = t.T_gov + t.T_azure + t.T_ds
-        else:
-            total = t.T_total
+    - mape:      mean absolute percentage error
 
-        if total <= 0.0:
-            # Skip degenerate tasks
-            continue
-
-        y_true.append(total)
-        y_pred.append(predict_time_for_task(t, params))
+    Task-provided proportions are used when all three are set; otherwise
+    they are computed from the times. Predictions are computed in one
+    vectorized pass; the tasks are not modified. Pass the DatasetArrays
+    used for fit_model to reuse its proportion and entropy columns.
+    """
+    if not isinstance(tasks, (Sequence, TaskTable, DatasetArrays)):
+        tasks = list(tasks)
 
-    if not y_true:
+    data = _as_dataset(tasks)
+    p_gov, p_azure, p_ds, y_true_arr = data.eval_valid_columns
+    if y_true_arr.size == 0:
         raise ValueError("No valid tasks for evaluation (all had zero or missing time).")
 
-    y_true_arr = np.asarray(y_true, dtype=float)
-    y_pred_arr = np.asarray(y_pred, dtype=float)
+    y_pred_arr = predict_times_from_proportions_batch(
+        p_gov,
+        p_azure,
+        p_ds,
+        params,
+        entropy=data.eval_entropy if params.use_entropy else None,
+    )
 
-    errors = y_pred_arr - y_true_arr
-    abs_errors = np.abs(errors)
-    sq_errors = errors**2
+    # MAPE: tasks with total <= 0 were skipped, so y_true_arr > 0 everywhere
+    abs_sum, sq_sum, ape_sum = _error_sums(y_true_arr, y_pred_arr)
 
-    mae = float(abs_errors.mean())
-    mse = float(sq_errors.mean())
+    n = y_true_arr.size
+    mae = abs_sum / n
+    mse = sq_sum / n
     rmse = float(np.sqrt(mse))
-
-    # MAPE: be careful with zeros
-    with np.errstate(divide="ignore", invalid="ignore"):
-        perc_errors = abs_errors / y_true_arr
-        perc_errors = perc_errors[~np.isnan(perc_errors) & ~np.isinf(perc_errors)]
-        mape = float(perc_errors.mean()) if perc_errors.size > 0 else 0.0
+    mape = ape_sum / n
 
     return {
-        "n": float(len(y_true)),
+        "n": float(n),
         "mae": mae,
         "mse": mse,
         "rmse": rmse,
@@ -5,15 +5,56 @@ No I/O, no Azure. Just:
 - Conversions between times and proportions
 - Entropy / mixing calculation
 - Time prediction given model parameters
+- Batch (NumPy array) versions of the above for whole datasets
+
+The scalar math lives in _kernels (Numba-compiled when available); the
+functions here are the public, ModelParams-aware wrappers. _kernels (and
+with it numba) is imported on first use, so importing this module for a
+one-off prediction stays cheap.
 """
 
 from __future__ import annotations
 
-import math
-from typing import Tuple
+from typing import Optional, Tuple
+
+import numpy as np
 
 from .schema import Task, ModelParams
 
+_kernels = None
+
+
+def _load_kernels():
+    """Import _kernels (numba, JIT / AOT kernels) on first use."""
+    global _kernels
+    if _kernels is None:
+        from . import _kernels as kernels
+
+        _kernels = kernels
+    return _kernels
+
+
+def _predict_fn(params: ModelParams):
+    """
+    The prediction kernel specialized for params.use_entropy.
+
+    The choice is cached on the instance together with the flag it was
+    made for, so repeated predictions skip the lookup and a later change
+    to use_entropy picks the other kernel.
+    """
+    use_entropy = params.use_entropy
+    try:
+        cached_flag, fn = params._predict_fn
+    except AttributeError:
+        pass
+    else:
+        if cached_flag == use_entropy:
+            return fn
+    kernels = _load_kernels()
+    fn = kernels.predict_entropy if use_entropy else kernels.predict_base
+    params._predict_fn = (use_entropy, fn)
+    return fn
+
 
 def proportions_from_times(
     T_gov: float,
@@ -65,11 +106,7 @@ def entropy_from_proportions(
 
     Uses natural log. Terms with p_i <= 0 are treated as zero.
     """
-    entropy = 0.0
-    for p in (p_gov, p_azure, p_ds):
-        if p > 0.0:
-            entropy -= p * math.log(p)
-    return entropy
+    return _load_kernels().entropy(float(p_gov), float(p_azure), float(p_ds))
 
 
 def predict_time_from_proportions(
@@ -87,26 +124,47 @@ def predict_time_from_proportions(
     If params.use_entropy is True:
         T_pred += eta * H(p)
     """
-    base = (
-        p_gov * params.T_gov_star
-        + p_azure * params.T_azure_star
-        + p_ds * params.T_ds_star
+    return _predict_fn(params)(
+        float(p_gov),
+        float(p_azure),
+        float(p_ds),
+        float(params.T_gov_star),
+        float(params.T_azure_star),
+        float(params.T_ds_star),
+        float(params.eta),
     )
 
-    if params.use_entropy:
-        H = entropy_from_proportions(p_gov, p_azure, p_ds)
-        return base + params.eta * H
-    return base
 
+def predict_time_pure(
+    task: Task,
+    params: ModelParams,
+) -> float:
+    """
+    Predict total time for a Task without modifying it.
+
+    Uses the task's p_* if all three are set, otherwise proportions
+    computed from its times (same rule as update_task_proportions).
+    """
+    p_gov, p_azure, p_ds = task.p_gov, task.p_azure, task.p_ds
+    if p_gov is None or p_azure is None or p_ds is None:
+        p_gov, p_azure, p_ds = proportions_from_times(
+            task.T_gov,
+            task.T_azure,
+            task.T_ds,
+        )
+
+    return predict_time_from_proportions(p_gov, p_azure, p_ds, params)
 
-def predict_time_for_task(
+
+def predict_and_update_task(
     task: Task,
     params: ModelParams,
 ) -> float:
     """
     Predict total time for a Task.
 
-    This will update the task's T_total and p_* fields if missing.
+    This will update the task's T_total and p_* fields if missing. Use
+    predict_time_pure when the task should be left untouched.
     """
     task = update_task_proportions(task)
 
@@ -120,3 +178,151 @@ def predict_time_for_task(
         task.p_ds,
         params,
     )
+
+
+# Backwards-compatible name for the mutating variant.
+predict_time_for_task = predict_and_update_task
+
+
+# --- Batch (array) versions ---------------------------------------------------
+
+# Below this many rows, thread start-up outweighs the parallel speedup
+_PARALLEL_MIN_ROWS = 10_000
+
+# Passed to the batch kernels for "compute H(p) per row"
+_NO_ENTROPY = np.empty(0, dtype=np.float64)
+
+
+def proportions_from_times_batch(
+    T_gov: np.ndarray,
+    T_azure: np.ndarray,
+    T_ds: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Array version of proportions_from_times.
+
+    Rows whose times sum to zero or less get all-zero proportions.
+    """
+    total = T_gov + T_azure + T_ds
+    inv = np.divide(1.0, total, out=np.zeros_like(total), where=total > 0.0)
+    return T_gov * inv, T_azure * inv, T_ds * inv
+
+
+def entropy_from_proportions_batch(
+    p_gov: np.ndarray,
+    p_azure: np.ndarray,
+    p_ds: np.ndarray,
+) -> np.ndarray:
+    """
+    Array version of entropy_from_proportions.
+
+    Uses scipy.special.entr (-p log p, 0 at p == 0, no log(0) masking);
+    p <= 0 contributes 0. Works in one scratch buffer plus the result.
+    """
+    # Imported here so scalar-only users (e.g. the CLI's predict) never
+    # load SciPy
+    from scipy.special import entr
+
+    H = np.maximum(p_gov, 0.0)
+    entr(H, out=H)
+    buf = np.empty_like(H)
+    for p in (p_azure, p_ds):
+        np.maximum(p, 0.0, out=buf)
+        entr(buf, out=buf)
+        H += buf
+    return H
+
+
+def predict_times_from_proportions_batch(
+    p_gov: np.ndarray,
+    p_azure: np.ndarray,
+    p_ds: np.ndarray,
+    params: ModelParams,
+    *,
+    entropy: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Array version of predict_time_from_proportions.
+
+    Large 1-D inputs run on a multi-threaded Numba kernel when numba is
+    installed (or the single-threaded ahead-of-time kernel, if built).
+    Otherwise the proportions (and H(p) for the entropy model) are stacked
+    into the training design layout for a single matrix-vector product.
+    Pass an already computed H(p) column as `entropy` to skip recomputing
+    it.
+    """
+    p_gov = np.ascontiguousarray(p_gov, dtype=np.float64)
+    kernel = _batch_kernel(p_gov)
+    if kernel is not None:
+        out = np.empty_like(p_gov)
+        kernel(
+            p_gov,
+            np.ascontiguousarray(p_azure, dtype=np.float64),
+            np.ascontiguousarray(p_ds, dtype=np.float64),
+            _NO_ENTROPY
+            if entropy is None
+            else np.ascontiguousarray(entropy, dtype=np.float64),
+            float(params.T_gov_star),
+            float(params.T_azure_star),
+            float(params.T_ds_star),
+            float(params.eta),
+            bool(params.use_entropy),
+            out,
+        )
+        return out
+
+    k = 4 if params.use_entropy else 3
+    P = np.empty((k,) + p_gov.shape, dtype=np.float64)
+    P[0] = p_gov
+    P[1] = p_azure
+    P[2] = p_ds
+    if params.use_entropy:
+        if entropy is None:
+            entropy = entropy_from_proportions_batch(p_gov, p_azure, p_ds)
+        P[3] = entropy
+    return predict_times_from_features(P, params)
+
+
+def _batch_kernel(p_gov: np.ndarray):
+    """Compiled batch predictor to use for p_gov, or None for NumPy."""
+    if p_gov.ndim != 1:
+        return None
+    from ._jit import NUMBA_AVAILABLE
+
+    kernels = _load_kernels()
+    if NUMBA_AVAILABLE and p_gov.size >= _PARALLEL_MIN_ROWS:
+        return kernels.predict_batch_kernel
+    return kernels.predict_batch_serial
+
+
+def predict_times_from_features(
+    features: np.ndarray,
+    params: ModelParams,
+) -> np.ndarray:
+    """
+    Predict times from stacked feature rows: theta @ features.
+
+    `features` has shape (k, N) with rows p_gov, p_azure, p_ds and, when
+    params.use_entropy, H(p) -- the transposed design matrix. Feature-
+    major rows keep the product a single contiguous BLAS gemv.
+    """
+    theta = [params.T_gov_star, params.T_azure_star, params.T_ds_star]
+    if params.use_entropy:
+        theta.append(params.eta)
+    return np.asarray(theta, dtype=np.float64) @ features
+
+
+def predict_times_batch(
+    T_gov: np.ndarray,
+    T_azure: np.ndarray,
+    T_ds: np.ndarray,
+    params: ModelParams,
+) -> np.ndarray:
+    """
+    Predict total time for many tasks given their raw time columns.
+
+    One vectorized sweep instead of a Python call per task. Proportions
+    are computed from the times (T_total does not enter the prediction).
+    """
+    p_gov, p_azure, p_ds = proportions_from_times_batch(T_gov, T_azure, T_ds)
+    return predict_times_from_proportions_batch(p_gov, p_azure, p_ds, params)
@@ -0,0 +1,56 @@
+"""
+The local CSV loader (pandas) and the Azure Blob loader (csv module,
+streamed chunks) must turn the same file into the same Tasks.
+"""
+
+from __future__ import annotations
+
+import csv
+
+import pytest
+
+from triangle_time.data_io import (
+    _iter_text_lines,
+    _tasks_from_csv_rows,
+    load_tasks_from_csv,
+)
+
+HEADER = "task_id,T_gov,T_azure,T_ds,T_total,p_gov,p_azure,p_ds\n"
+
+CASES = {
+    # Excel-style exports end every data row with a comma
+    "trailing_comma": "task_id,T_gov,T_azure,T_ds\na,1,2,3,\nb,4,5,6,\n",
+    # One row carries an extra field, another is short
+    "ragged_rows": "task_id,T_gov,T_azure,T_ds\na,1,2,3\nb,4,5,6,7\nc,1\n",
+    "na_like_ids": HEADER + "NA,1,2,3,,,,\nNone,1,2,3,,,,\nnull,1,2,3,,,,\n",
+    "invalid_cells": HEADER + "x,1,abc,3,abc,xyz,0.5,\n,1,,3,,0.2,0.3,0.5\n",
+    "header_only": HEADER,
+}
+
+
+def _load_like_blob(data: bytes):
+    # Small chunks so boundaries fall inside rows
+    chunks = [data[i : i + 7] for i in range(0, len(data), 7)]
+    return _tasks_from_csv_rows(csv.reader(_iter_text_lines(chunks, "utf-8")))
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_local_and_blob_loaders_agree(tmp_path, name):
+    path = tmp_path / f"{name}.csv"
+    path.write_text(CASES[name], encoding="utf-8", newline="")
+
+    assert load_tasks_from_csv(str(path)) == _load_like_blob(path.read_bytes())
+
+
+def test_trailing_comma_keeps_columns_aligned(tmp_path):
+    path = tmp_path / "tasks.csv"
+    path.write_text(CASES["trailing_comma"], encoding="utf-8", newline="")
+
+    first = load_tasks_from_csv(str(path))[0]
+
+    assert (first.task_id, first.T_gov, first.T_azure, first.T_ds) == (
+        "a",
+        1.0,
+        2.0,
+        3.0,
+    )
@@ -0,0 +1,124 @@
+"""
+Tests for the background /log_task writer in app.api.
+
+The CSV append itself is replaced with a recorder, so these only check
+how queued tasks are grouped into batches and when they are flushed.
+"""
+
+from __future__ import annotations
+
+import csv
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import api
+from triangle_time.schema import Task
+
+
+class _Recorder:
+    """Stands in for append_tasks_to_csv and records each batch."""
+
+    def __init__(self, fail_first: int = 0) -> None:
+        self.batches: list[list[str]] = []
+        self.fail_first = fail_first
+        self.calls = 0
+        self.written = threading.Event()
+
+    def __call__(self, tasks, path=None) -> None:
+        self.calls += 1
+        if self.calls <= self.fail_first:
+            raise csv.Error("simulated write failure")
+        self.batches.append([t.task_id for t in tasks])
+        self.written.set()
+
+
+def _task(i: int) -> Task:
+    return Task(task_id=f"T-{i}", T_gov=1.0, T_azure=2.0, T_ds=3.0)
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    rec = _Recorder()
+    monkeypatch.setattr(api, "append_tasks_to_csv", rec)
+    yield rec
+    api._stop_log_writer()
+
+
+def test_batches_are_capped_at_batch_size(monkeypatch, recorder):
+    monkeypatch.setattr(api, "LOG_BATCH_SIZE", 3)
+    monkeypatch.setattr(api, "LOG_FLUSH_MS", 10_000.0)
+
+    # Queue everything before the writer starts so the grouping is fixed
+    for i in range(7):
+        api._LOG_QUEUE.put(_task(i))
+    api._start_log_writer()
+    api._stop_log_writer()
+
+    assert recorder.batches == [
+        ["T-0", "T-1", "T-2"],
+        ["T-3", "T-4", "T-5"],
+        ["T-6"],
+    ]
+
+
+def test_partial_batch_is_flushed_after_deadline(monkeypatch, recorder):
+    monkeypatch.setattr(api, "LOG_BATCH_SIZE", 100)
+    monkeypatch.setattr(api, "LOG_FLUSH_MS", 50.0)
+    api._start_log_writer()
+
+    api.enqueue_task_log(_task(0))
+
+    # Written while the writer keeps running, not only at shutdown
+    assert recorder.written.wait(timeout=5.0)
+    assert recorder.batches == [["T-0"]]
+    assert api._LOG_WRITER is not None and api._LOG_WRITER.is_alive()
+
+
+def test_shutdown_drains_queued_tasks(monkeypatch, recorder):
+    monkeypatch.setattr(api, "LOG_BATCH_SIZE", 100)
+    monkeypatch.setattr(api, "LOG_FLUSH_MS", 60_000.0)
+    api._start_log_writer()
+
+    for i in range(5):
+        api.enqueue_task_log(_task(i))
+    start = time.monotonic()
+    api._stop_log_writer()
+
+    # Shutdown must not wait for the flush deadline
+    assert time.monotonic() - start < 5.0
+    assert [tid for batch in recorder.batches for tid in batch] == [
+        f"T-{i}" for i in range(5)
+    ]
+    assert api._LOG_WRITER is None
+
+
+def test_writer_survives_failed_write(monkeypatch, recorder, caplog):
+    recorder.fail_first = 1
+    monkeypatch.setattr(api, "LOG_BATCH_SIZE", 1)
+    monkeypatch.setattr(api, "LOG_FLUSH_MS", 0.0)
+
+    for i in range(3):
+        api._LOG_QUEUE.put(_task(i))
+    api._start_log_writer()
+    api._stop_log_writer()
+
+    # The first batch is lost and logged; the rest are still written
+    assert recorder.batches == [["T-1"], ["T-2"]]
+    assert "Failed to write 1 task(s)" in caplog.text
+
+
+def test_enqueue_writes_synchronously_without_writer(recorder):
+    assert api._LOG_WRITER is None
+
+    api.enqueue_task_log(_task(0))
+
+    assert recorder.batches == [["T-0"]]
+
+
+def test_lifespan_starts_and_stops_writer(recorder):
+    with TestClient(api.app):
+        assert api._LOG_WRITER is not None and api._LOG_WRITER.is_alive()
+    assert api._LOG_WRITER is None
@@ -0,0 +1,100 @@
+"""
+fit_model and fit_model_from_arrays against a plain np.linalg.lstsq fit.
+
+The cases cover each solver path: Cholesky on well-conditioned data, the
+QR / lstsq fallback when the normal equations are singular (constant
+proportions) and when there are fewer tasks than parameters.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from triangle_time.schema import TaskTable
+from triangle_time.training import (
+    _feature_columns,
+    _gram_from_columns,
+    _solve_cholesky,
+    fit_model,
+    fit_model_from_arrays,
+    prepare_dataset,
+)
+
+
+def _well_conditioned() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.uniform(0.5, 10.0, size=(200, 3))
+
+
+def _constant_proportions() -> np.ndarray:
+    # Every task has p = (0.2, 0.3, 0.5), so X has rank 1
+    scale = np.linspace(1.0, 20.0, 50)
+    return np.outer(scale, [2.0, 3.0, 5.0])
+
+
+def _fewer_tasks_than_parameters() -> np.ndarray:
+    # data/samples/example_tasks.csv
+    return np.array([[2.0, 3.0, 1.0], [1.0, 4.0, 2.0], [5.0, 1.0, 0.5]])
+
+
+CASES = {
+    "well_conditioned": _well_conditioned,
+    "constant_proportions": _constant_proportions,
+    "fewer_tasks_than_parameters": _fewer_tasks_than_parameters,
+}
+
+
+def _table(times: np.ndarray) -> TaskTable:
+    return TaskTable.from_columns(
+        {"T_gov": times[:, 0], "T_azure": times[:, 1], "T_ds": times[:, 2]}
+    )
+
+
+def _reference_beta(times: np.ndarray, use_entropy: bool) -> np.ndarray:
+    y = times.sum(axis=1)
+    X = times / y[:, None]
+    if use_entropy:
+        H = -(X * np.log(X)).sum(axis=1)
+        X = np.column_stack([X, H])
+    beta, *_ = np.linalg.lstsq(X, y, rcond=None)
+    return beta
+
+
+def _beta(params, use_entropy: bool) -> np.ndarray:
+    beta = [params.T_gov_star, params.T_azure_star, params.T_ds_star]
+    if use_entropy:
+        beta.append(params.eta)
+    return np.array(beta)
+
+
+@pytest.mark.parametrize("fit", [fit_model, fit_model_from_arrays])
+@pytest.mark.parametrize("use_entropy", [False, True])
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_fit_matches_lstsq(name, use_entropy, fit):
+    times = CASES[name]()
+
+    params = fit(_table(times), use_entropy=use_entropy)
+
+    np.testing.assert_allclose(
+        _beta(params, use_entropy),
+        _reference_beta(times, use_entropy),
+        rtol=1e-7,
+        atol=1e-7,
+    )
+
+
+@pytest.mark.parametrize(
+    "name, uses_cholesky",
+    [
+        ("well_conditioned", True),
+        ("constant_proportions", False),
+        ("fewer_tasks_than_parameters", False),
+    ],
+)
+def test_cases_cover_each_solver(name, uses_cholesky):
+    features, y = _feature_columns(prepare_dataset(_table(CASES[name]())), True)
+
+    beta = _solve_cholesky(*_gram_from_columns(features, y))
+
+    assert (beta is not None) == uses_cholesky
@@ -0,0 +1,51 @@
+"""
+Tests for the ModelParams-aware prediction wrappers in triangle_model.
+"""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from triangle_time.schema import ModelParams
+from triangle_time.triangle_model import (
+    entropy_from_proportions,
+    predict_time_from_proportions,
+)
+
+P = (0.2, 0.3, 0.5)
+
+
+def _params(use_entropy: bool) -> ModelParams:
+    return ModelParams(
+        T_gov_star=1.0,
+        T_azure_star=2.0,
+        T_ds_star=3.0,
+        eta=5.0,
+        use_entropy=use_entropy,
+    )
+
+
+def test_prediction_follows_use_entropy():
+    base = 0.2 * 1.0 + 0.3 * 2.0 + 0.5 * 3.0
+    mixing = 5.0 * entropy_from_proportions(*P)
+
+    assert predict_time_from_proportions(*P, _params(False)) == pytest.approx(base)
+    assert predict_time_from_proportions(*P, _params(True)) == pytest.approx(
+        base + mixing
+    )
+
+
+@pytest.mark.parametrize("initial", [True, False])
+def test_flipping_use_entropy_picks_the_other_kernel(initial):
+    params = _params(initial)
+    first = predict_time_from_proportions(*P, params)
+
+    params.use_entropy = not initial
+    flipped = predict_time_from_proportions(*P, params)
+
+    assert flipped == pytest.approx(
+        predict_time_from_proportions(*P, _params(not initial))
+    )
+    assert not math.isclose(first, flipped)